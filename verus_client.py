@@ -1,23 +1,412 @@
 #!/usr/bin/env python3
+import itertools
 import json
+import socket
 import requests
+from collections import OrderedDict
+from urllib.parse import quote_plus
+
+# orjson is substantially faster than stdlib json at both encoding and
+# decoding (which dominates Python-side cost for large getblock /
+# getrawtransaction replies). Fall back to stdlib when unavailable;
+# _dumps always returns bytes so both paths feed requests identically.
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    # Construct the encoder/decoder once at import instead of going
+    # through the json.dumps/json.loads front doors on every call; the
+    # compact separators also shave bytes off each payload.
+    _ENCODER = json.JSONEncoder(separators=(",", ":"))
+    _DECODER = json.JSONDecoder()
+    def _dumps(obj):
+        return _ENCODER.encode(obj).encode("utf-8")
+    def _loads(data):
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode("utf-8")
+        return _DECODER.decode(data)
+
+# httpx backs the optional AsyncVerusClient; the synchronous client does
+# not need it.
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# requests-unixsocket enables talking to a daemon over a Unix domain
+# socket (socket_path=...), skipping the TCP stack entirely on localhost.
+try:
+    import requests_unixsocket
+except ImportError:
+    requests_unixsocket = None
+
+# pysimdjson SIMD-parses large bodies and exposes lazy proxies, so a
+# multi-megabyte getblock(verbosity=2) reply is not materialized into a
+# Python dict tree until fields are actually touched.
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# Bodies above this size are parsed lazily with simdjson when available.
+_SIMDJSON_THRESHOLD = 64 * 1024
+
+# RPC methods whose responses are immutable once confirmed
+# (content-addressed), so they are safe to answer from a local cache.
+# Height-keyed queries (getblockhash, getblock by height) and chain-tip /
+# wallet / mining queries are deliberately excluded: a height can point
+# at a different block after a reorg.
+_IMMUTABLE_METHODS = frozenset({"getblock", "getrawtransaction"})
+
+_CACHE_MAXSIZE = 4096
+
+# The envelope of every request is constant; only the id, method and
+# params vary. Splicing their encoded forms into this template skips
+# building (and serializing) the outer dict on each call. Ids are
+# monotonic per client so batch responses can be matched in O(1) and
+# daemon logs can tell requests apart.
+_PAYLOAD_TEMPLATE = b'{"jsonrpc":"2.0","id":%d,"method":%b,"params":%b}'
+
+# Flip on to build and serialize the payload dict normally (easier to
+# inspect in a debugger or proxy).
+_DEBUG_PAYLOADS = False
+
+
+def _encode_request(method, params, req_id):
+    """
+    Encode one JSON-RPC request body as bytes.
+    """
+    if _DEBUG_PAYLOADS:
+        return _dumps({"jsonrpc": "2.0", "id": req_id, "method": method, "params": params})
+    return _PAYLOAD_TEMPLATE % (req_id, _dumps(method), _dumps(params))
+
+
+def _decode_response(content):
+    """
+    Decode a JSON-RPC response body. Large bodies go through simdjson's
+    lazy parser when available; its proxies support the same keyed access
+    as a dict. A fresh parser is used per document because reusing one
+    invalidates previously returned proxies.
+    """
+    if simdjson is not None and len(content) > _SIMDJSON_THRESHOLD:
+        return simdjson.Parser().parse(content)
+    return _loads(content)
+
+
+class NoDelayHTTPAdapter(requests.adapters.HTTPAdapter):
+    """
+    HTTPAdapter that disables Nagle's algorithm and turns on TCP
+    keepalive for pooled sockets. RPC requests are mostly sub-1 KB, and
+    Nagle plus delayed ACK can add ~40 ms of stall per call against a
+    remote daemon.
+    """
+    _SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self._SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _extract_rpc_error(content):
+    """
+    Pull the JSON-RPC error object out of an HTTP error body, if there is
+    one. The daemon reports RPC failures as HTTP 500 while still sending
+    the normal JSON-RPC envelope.
+    """
+    try:
+        return _loads(content).get("error")
+    except Exception:
+        return None
+
+
+def _raise_http_error(response):
+    """
+    Raise for a non-2xx daemon response: VerusRPCError when the body
+    carries a JSON-RPC error object, requests.HTTPError otherwise (auth
+    failures, proxies, non-JSON bodies). Split out so the happy path is a
+    single status-code comparison rather than a raise_for_status() call.
+    """
+    error = _extract_rpc_error(response.content)
+    if error is not None:
+        _raise_rpc_error(error)
+    raise requests.HTTPError(f"{response.status_code}: {response.reason}", response=response)
+
+
+class VerusRPCError(Exception):
+    """
+    Raised when the daemon returns a JSON-RPC error. The error object's
+    code and data fields are available as attributes so callers can
+    handle specific daemon errors programmatically.
+    """
+
+    def __init__(self, message, code=None, data=None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+
+def _raise_rpc_error(error):
+    raise VerusRPCError(error.get("message", str(error)), code=error.get("code"), data=error.get("data"))
+
+
+def _unwrap_reply(reply):
+    """
+    Extract the "result" value from a decoded reply, raising
+    VerusRPCError when the daemon reports an error. The daemon sends
+    "result": null alongside "error" on failure, so the error lookup is
+    only paid when result is null.
+    """
+    result = reply.get("result")
+    if result is None:
+        error = reply.get("error")
+        if error is not None:
+            _raise_rpc_error(error)
+    return result
 
 class VerusResponseData:
-    def __init__(self, **entries):
-        self.__dict__.update(entries)
-        self.response = None
+    """
+    Attribute-style view over a decoded RPC result. Holds a single
+    reference to the result dict instead of copying every key into the
+    instance, so construction is O(1) and large getblock /
+    getrawtransaction results are not duplicated in memory. The raw dict
+    remains available as .response.
+
+    Attribute lookup hits the (lazily created) instance dict first, so
+    callers can still stash their own attributes on a response object;
+    __getattr__ only runs for fields that were not explicitly set.
+    """
+    __slots__ = ("_data", "__dict__")
+
+    def __init__(self, data):
+        self._data = data
+
+    @property
+    def response(self):
+        try:
+            return self.__dict__["response"]
+        except KeyError:
+            return self._data
+
+    @response.setter
+    def response(self, value):
+        # The baseline class assigned .response itself and callers may
+        # have copied that; shadow the property via the instance dict so
+        # the assignment sticks without touching the result data.
+        self.__dict__["response"] = value
+
+    def __getattr__(self, name):
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
 
     def __repr__(self):
-        contents = ', '.join(f"{k}={v!r}" for k, v in self.__dict__.items())
+        contents = ', '.join(f"{k}={v!r}" for k, v in self._data.items())
         return f"{self.__class__.__name__}({contents})"
 
-class VerusClient:
-    def __init__(self, host='127.0.0.1', network='mainnet', rpc_user='username', rpc_password='password'):
+class VerusBatchCall:
+    """
+    Placeholder for one call queued in a batch. .result is populated when
+    the enclosing batch() block exits and the combined request returns;
+    if the daemon rejected this particular call, .error holds its error
+    object instead.
+    """
+    __slots__ = ("method", "params", "result", "error")
+
+    def __init__(self, method, params):
+        self.method = method
+        self.params = params
+        self.result = None
+        self.error = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(method={self.method!r}, params={self.params!r}, result={self.result!r}, error={self.error!r})"
+
+
+class _Batch:
+    """
+    Proxy that records RPC calls instead of sending them, then issues the
+    whole batch as one JSON-RPC array POST when the with-block exits.
+    Exposes the same wrapper methods as the owning client; each call
+    returns a VerusBatchCall whose .result is filled in on exit.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    def _rpc_request(self, method, params):
+        call = VerusBatchCall(method, params)
+        self._calls.append(call)
+        return call
+
+    def _rpc_request_static(self, method, body_template):
+        return self._rpc_request(method, ())
+
+    def _call(self, method, params):
+        return self._rpc_request(method, params)
+
+    def _handle_response(self, call):
+        return call
+
+    # The specialized tail must also hand back the placeholder.
+    _handle_object = _handle_response
+
+    def __getattr__(self, name):
+        # Reuse the client's own wrappers (including their params
+        # building) with this proxy standing in for the client.
+        return getattr(type(self._client), name).__get__(self, _Batch)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self._send()
+
+    def _send(self):
+        if not self._calls:
+            return
+        client = self._client
+        id_to_call = {next(client._id): call for call in self._calls}
+        body = b"[" + b",".join(
+            _encode_request(call.method, call.params, req_id)
+            for req_id, call in id_to_call.items()
+        ) + b"]"
+        response = client._session.post(client.url, data=body)
+        if response.status_code >= 400:
+            _raise_http_error(response)
+        results = _decode_response(response.content)
+        # The spec allows batch responses in any order; match by id.
+        # Fulfill every answered call before raising, so one bad call
+        # does not discard the rest of the chunk's results, and point
+        # the raised error at the call that failed.
+        failed = None
+        for result in results:
+            call = id_to_call[result["id"]]
+            error = result.get("error")
+            if error is not None:
+                call.error = error
+                if failed is None:
+                    failed = call
+            else:
+                call.result = client._handle_response(result.get("result"))
+        if failed is not None:
+            error = failed.error
+            raise VerusRPCError(
+                f"{error.get('message', str(error))} "
+                f"(batched {failed.method} with params {failed.params!r})",
+                code=error.get("code"), data=error.get("data"))
+
+
+class _BespokeRPCMethods:
+    """
+    RPC wrappers whose params need bespoke construction, shared by the
+    sync and async clients. Bodies route through self._call, which each
+    client defines to send synchronously or asynchronously as
+    appropriate (and which the batch proxy defines to record the call).
+    """
+
+    def help(self, command=None):
+        """
+        Returns help text for all commands or a specified command.
+        """
+        params = [command] if command is not None else []
+        return self._call("help", params)
+
+    def setgenerate(self, generate, genproclimit=None):
+        """
+        Sets mining/minting on or off.
+        generate: boolean; genproclimit: number of processor threads (or 0 for staking).
+        """
+        params = [generate]
+        if genproclimit is not None:
+            params.append(genproclimit)
+        return self._call("setgenerate", params)
+
+    def estimateconversion(self, amount, from_currency, to_currency, via=None):
+        param_obj = {
+            "currency": from_currency,
+            "convertto": to_currency,
+            "amount": amount
+        }
+
+        if via:
+            param_obj["via"] = via
+
+        return self._call("estimateconversion", [param_obj])
+
+    def getcurrencystate(self, currency, n=None, conversiondatacurrency=None):
+        """
+        Returns the state of the specified currency.
+        Parameters:
+        currency: currency name or ID.
+        n: (optional) an additional numeric parameter.
+        conversiondatacurrency: (optional) currency to provide conversion data for.
+        """
+        # n sits in the middle of the positional args, so it only gets
+        # omitted when conversiondatacurrency is omitted too; otherwise
+        # an empty-string placeholder keeps the daemon's arg positions.
+        params = [currency] \
+            + ([n] if n is not None else ([""] if conversiondatacurrency is not None else [])) \
+            + ([conversiondatacurrency] if conversiondatacurrency is not None else [])
+        return self._call("getcurrencystate", params)
+
+    def getimports(self, currency, heightstart=None, heightend=None):
+        """
+        Returns a list of import transactions.
+        Parameters:
+        currency: the chain or currency name for which to fetch the exports
+        startheight: (optional) return imports above this block height
+        endheight: (optional) return imports below this block height
+        """
+        params = [currency] \
+            + ([heightstart] if heightstart is not None else [""]) \
+            + ([heightend] if heightend is not None else [])
+        return self._call("getimports", params)
+
+    def getexports(self, currency, heightstart=None, heightend=None):
+        """
+        Returns a list of export transactions.
+        Parameters:
+        currency: the chain or currency name for which to fetch the exports
+        startheight: (optional) return exports above this block height
+        endheight: (optional) return exports below this block height
+        """
+        params = [currency] \
+            + ([heightstart] if heightstart is not None else [""]) \
+            + ([heightend] if heightend is not None else [])
+        return self._call("getexports", params)
+
+    def getrawtransaction(self, txid, verbose=True):
+        """
+        Returns the raw transaction data for the given transaction ID.
+        Parameters:
+        txid: the transaction ID.
+        verbose: if True, returns a JSON object; if False, returns raw hex.
+        """
+
+        verbose_flag = 1 if verbose else ""
+
+        return self._call("getrawtransaction", (txid, verbose_flag))
+
+
+class VerusClient(_BespokeRPCMethods):
+    def __init__(self, host='127.0.0.1', network='mainnet', rpc_user='username', rpc_password='password', cache=True, socket_path=None):
         """ Initialize the client. host: hostname where the daemon is running.
         network: 'mainnet' or 'testnet'
         rpc_user and rpc_password: credentials for RPC access.
+        cache: keep an in-process LRU cache of immutable responses
+        (hash-keyed blocks and raw transactions).
+        socket_path: (optional) path to a Unix domain socket to connect
+        through instead of TCP; requires the requests-unixsocket package.
         """
-        
+
         self.host = host
         self.network = network.lower()
         self.rpc_user = rpc_user
@@ -32,89 +421,149 @@ class VerusClient:
         else:
             raise ValueError("Network must be 'mainnet' or 'testnet'")
 
-        self.url = f"http://{self.host}:{self.port}/"
+        # A persistent session keeps the connection alive between calls
+        # instead of paying the connect/auth handshake on every request.
+        self._session = requests.Session()
+        self._session.auth = (self.rpc_user, self.rpc_password)
+        # Verbose block JSON compresses ~6x; advertising gzip lets any
+        # compressing proxy in front of the daemon shrink the transfer,
+        # and requests decompresses transparently.
+        self._session.headers.update({
+            "content-type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+        })
+        if socket_path is not None:
+            if requests_unixsocket is None:
+                raise ImportError("socket_path support requires the requests-unixsocket package")
+            self.url = f"http+unix://{quote_plus(socket_path)}/"
+            self._session.mount(self.url, requests_unixsocket.UnixAdapter())
+        else:
+            self.url = f"http://{self.host}:{self.port}/"
+            self._session.mount(self.url, NoDelayHTTPAdapter(pool_connections=10, pool_maxsize=10))
 
-    def _rpc_request(self, method, params):
+        self._cache = OrderedDict() if cache else None
+        self._id = itertools.count()
+
+    def clear_cache(self):
         """
-        Internal method to send an RPC request.
+        Drop any locally cached RPC responses.
         """
-        payload = {
-            "jsonrpc": "1.0",
-            "id": "python-client",
-            "method": method,
-            "params": params
-        }
-        headers = {"content-type": "text/plain"}
-        response = requests.post(
-            self.url,
-            auth=(self.rpc_user, self.rpc_password),
-            data=json.dumps(payload),
-            headers=headers
-        )
-        response.raise_for_status()
-        result = response.json()
-        if result.get("error") is not None:
-            raise Exception(f"RPC Error: {result['error']}")
-        return result
+        if self._cache is not None:
+            self._cache.clear()
 
-    def _handle_response(self, response):
+    def batch(self):
         """
-        Process the JSON RPC response
+        Queue several RPC calls and send them as one HTTP request:
+
+            with client.batch() as b:
+                hashes = [b.getblockhash(i) for i in range(1000)]
+            first = hashes[0].result
+
+        Amortizes the HTTP round-trip and auth over the whole batch.
         """
-        res = response.get("result")
-        if isinstance(res, dict):
-            #res['response'] = res
-            data = VerusResponseData(**res)
-            data.response = res
-            return data
-        else:
-            return res
+        return _Batch(self)
 
-    #RPC Calls
+    def iter_blocks(self, start, end, verbosity=1, batch_size=200):
+        """
+        Iterate over blocks by height in [start, end), yielding each
+        block as getblock would return it. Heights are resolved to
+        hashes and fetched in batches of batch_size, so a scan costs
+        2 * ceil(N / batch_size) HTTP requests instead of 2 * N.
+        """
+        for chunk_start in range(start, end, batch_size):
+            chunk = range(chunk_start, min(chunk_start + batch_size, end))
+            with self.batch() as b:
+                hash_calls = [b.getblockhash(i) for i in chunk]
+            with self.batch() as b:
+                block_calls = [b.getblock(call.result, verbosity) for call in hash_calls]
+            for call in block_calls:
+                yield call.result
 
-    def getinfo(self):
+    def close(self):
         """
-        Returns an object containing various state info.
+        Close the underlying HTTP session and its pooled connections.
         """
-        response = self._rpc_request("getinfo", [])
-        return self._handle_response(response)
+        self._session.close()
 
-    def getwalletinfo(self):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _rpc_request(self, method, params):
         """
-        Returns an object containing wallet information.
+        Internal method to send an RPC request. Returns the unwrapped
+        "result" value; a daemon-side error raises VerusRPCError.
+        Immutable methods (see _IMMUTABLE_METHODS) are answered from the
+        LRU cache when possible, so tight loops over a block range only
+        pay each RPC once.
         """
-        response = self._rpc_request("getwalletinfo", [])
-        return self._handle_response(response)
+        # getblock is only immutable when keyed by hash; a height can
+        # point at a different block after a reorg, so height-keyed
+        # lookups always go to the daemon.
+        if (self._cache is not None and method in _IMMUTABLE_METHODS
+                and (method != "getblock" or (params and isinstance(params[0], str)))):
+            cache_key = (method, _dumps(params))
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                return cached
+        else:
+            cache_key = None
 
-    def help(self, command=None):
+        response = self._session.post(self.url, data=_encode_request(method, params, next(self._id)))
+        if response.status_code >= 400:
+            _raise_http_error(response)
+        result = _unwrap_reply(_decode_response(response.content))
+        if cache_key is not None:
+            self._cache[cache_key] = result
+            if len(self._cache) > _CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
+        return result
+
+    def _rpc_request_static(self, method, body_template):
         """
-        Returns help text for all commands or a specified command.
+        Send a zero-arg RPC whose body was pre-encoded when the wrapper
+        was generated; only the id is spliced in per call. method is
+        unused here but keeps the call recordable by the batch proxy.
         """
-        params = [command] if command is not None else []
-        response = self._rpc_request("help", params)
-        return self._handle_response(response)
+        response = self._session.post(self.url, data=body_template % next(self._id))
+        if response.status_code >= 400:
+            _raise_http_error(response)
+        return _unwrap_reply(_decode_response(response.content))
 
-    def stop(self):
+    def _handle_response(self, res):
         """
-        Stops the Verus daemon.
+        Wrap an RPC result for attribute-style access when it is an object.
         """
-        response = self._rpc_request("stop", [])
-        return self._handle_response(response)
+        if isinstance(res, dict):
+            return VerusResponseData(res)
+        elif simdjson is not None and isinstance(res, simdjson.Object):
+            # Lazily parsed large response; the proxy indexes like a dict.
+            return VerusResponseData(res)
+        else:
+            return res
 
-    def getnewaddress(self):
+    def _handle_object(self, res):
         """
-        Returns a new address from the keypool and marks it as used.
+        Specialized handler for methods whose result is always an object.
         """
-        response = self._rpc_request("getnewaddress", [])
-        return self._handle_response(response)
+        return VerusResponseData(res)
 
-    def validateaddress(self, address):
+    def _call(self, method, params):
         """
-        Returns a new address from the keypool and marks it as used.
+        Send one RPC and wrap its result; entry point for the shared
+        bespoke wrappers in _BespokeRPCMethods.
         """
-        response = self._rpc_request("validateaddress", [address])
-        return self._handle_response(response)
+        return self._handle_response(self._rpc_request(method, params))
 
+    #RPC Calls
+    #
+    # The straightforward wrappers (getinfo, getblock, getblockhash, ...)
+    # are generated from _RPC_SPECS below the class; methods with bespoke
+    # params handling live in _BespokeRPCMethods, shared with the async
+    # client.
 
 #    def getaddressbalance(self, addresses):
 #        """
@@ -183,23 +632,6 @@ class VerusClient:
 #        response = self._rpc_request("coinsupply", params)
 #        return self._handle_response(response)
 #
-    def getbestblockhash(self):
-        """
-        Returns the hash of the best (tip) block in the longest chain.
-        """
-        response = self._rpc_request("getbestblockhash", [])
-        return self._handle_response(response)
-
-    def getblock(self, hash_or_height, verbosity=1):
-        """
-        Returns block data.
-        - If verbosity=0, returns hex-encoded block data.
-        - If verbosity=1, returns a JSON object.
-        - If verbosity=2, includes detailed transaction data.
-        """
-        response = self._rpc_request("getblock", [hash_or_height, verbosity])
-        return self._handle_response(response)
-
 #    def getblockchaininfo(self):
 #        """
 #        Returns an object containing various state info regarding blockchain processing.
@@ -207,13 +639,6 @@ class VerusClient:
 #        response = self._rpc_request("getblockchaininfo", [])
 #        return self._handle_response(response)
 #
-    def getblockcount(self):
-        """
-        Returns the number of blocks in the best valid chain.
-        """
-        response = self._rpc_request("getblockcount", [])
-        return self._handle_response(response)
-
 #    def getblockdeltas(self, blockhash):
 #        """
 #        Returns detailed information (deltas) about a given block.
@@ -221,13 +646,6 @@ class VerusClient:
 #        response = self._rpc_request("getblockdeltas", [blockhash])
 #        return self._handle_response(response)
 #
-    def getblockhash(self, index):
-        """
-        Returns the hash of the block at the given index.
-        """
-        response = self._rpc_request("getblockhash", [index])
-        return self._handle_response(response)
-
 #    def getblockhashes(self, high, low, options=None):
 #        """
 #        Returns an array of block hashes within the given timestamp range.
@@ -375,31 +793,6 @@ class VerusClient:
 #        response = self._rpc_request("generate", [numblocks])
 #        return self._handle_response(response)
 #
-    def getgenerate(self):
-        """
-        Returns whether the daemon is set to mine/mint coins.
-        """
-        response = self._rpc_request("getgenerate", [])
-        return self._handle_response(response)
-
-    def setgenerate(self, generate, genproclimit=None):
-        """
-        Sets mining/minting on or off.
-        generate: boolean; genproclimit: number of processor threads (or 0 for staking).
-        """
-        params = [generate]
-        if genproclimit is not None:
-            params.append(genproclimit)
-        response = self._rpc_request("setgenerate", params)
-        return self._handle_response(response)
-
-    def getmininginfo(self):
-        """
-        Returns whether the daemon is set to mine/mint coins.
-        """
-        response = self._rpc_request("getmininginfo", [])
-        return self._handle_response(response)
-
 #    # CROSSCHAIN calls
 #
 #    def MoMoMdata(self, symbol, kmdheight, ccid):
@@ -484,96 +877,6 @@ class VerusClient:
 #
 #    # ADDITIONAL CALLS
 #
-    def estimateconversion(self, amount, from_currency, to_currency, via=None):
-        param_obj = {
-            "currency": from_currency,
-            "convertto": to_currency,
-            "amount": amount
-        }
-
-        if via:
-            param_obj["via"] = via
-
-        # Now pass a single dict (which _rpc_request will encode as JSON)
-        response = self._rpc_request("estimateconversion", [param_obj])
-        return self._handle_response(response)
-
-    def getcurrency(self, currency):
-        """
-        Returns details for a specified currency.
-        """
-        response = self._rpc_request("getcurrency", [currency])
-        return self._handle_response(response)
-
-    def getcurrencystate(self, currency, n=None, conversiondatacurrency=None):
-        """
-        Returns the state of the specified currency.
-        Parameters:
-        currency: currency name or ID.
-        n: (optional) an additional numeric parameter.
-        connectedchainid: (optional) the connected chain ID.
-        """
-        params = [currency]
-        if n is not None:
-            params.append(n)
-        else:
-            params.append("")
-
-        if conversiondatacurrency is not None:
-            params.append(conversiondatacurrency)
-
-        response = self._rpc_request("getcurrencystate", params)
-        return self._handle_response(response)
-
-    def getcurrencyconverters(self, currency1, currency2):
-        """
-        Returns a list of available currency converters.
-        """
-        #TODO: add overloaded options
-        response = self._rpc_request("getcurrencyconverters", [currency1, currency2])
-        return self._handle_response(response)
-
-    def getimports(self, currency, heightstart=None, heightend=None):
-        """
-        Returns a list of import transactions.
-        Parameters:
-        currency: the chain or currency name for which to fetch the exports
-        startheight: (optional) return imports above this block height
-        endheight: (optional) return imports below this block height
-        """
-        params = [currency]
-        if heightstart is not None:
-            params.append(heightstart)
-        else:
-            params.append("")
-
-        if heightend is not None:
-                params.append(heightend)
-
-        response = self._rpc_request("getimports", [currency])
-        return self._handle_response(response)
-
-    def getexports(self, curency, heightstart=None, heightend=None):
-        """
-        Returns a list of export transactions.
-        Parameters:
-        currency: the chain or currency name for which to fetch the imports
-        startheight: (optional) return exports above this block height
-        endheight: (optional) return exports below this block height
-        """
-
-        params = [currency]
-        if heightstart is not None:
-            params.append(heightstart)
-        else:
-            params.append("")
-
-        if heightend is not None:
-                params.append(heightend)
-
-        response = self._rpc_request("getexports", [])
-        return self._handle_response(response)
-
 #    def listtransactions(self, count=10, skip=0):
 #        """
 #        Returns a list of transactions.
@@ -584,29 +887,6 @@ class VerusClient:
 #        response = self._rpc_request("listtransactions", [count, skip])
 #        return self._handle_response(response)
 #
-    def getrawtransaction(self, txid, verbose=True):
-        """
-        Returns the raw transaction data for the given transaction ID.
-        Parameters:
-        txid: the transaction ID.
-        verbose: if True, returns a JSON object; if False, returns raw hex.
-        """
-
-        verbose_flag = 1 if verbose else "" 
-
-        response = self._rpc_request("getrawtransaction", [txid, verbose_flag])
-        return self._handle_response(response)
-
-    def getidentity(self, identity):
-        """
-        Returns details for a specified identity.
-	Parameters:
-        identity: name (@-terminated) or i-address)
-        """
-
-        response = self._rpc_request("getidentity", [identity])
-        return self._handle_response(response)
-
 #    def updateidentity(self, identityid, new_data):
 #        """
 #        Updates an identity with new data.
@@ -699,3 +979,208 @@ class VerusClient:
 #            params.append(extra_params)
 #        response = self._rpc_request("sendcurrency", params)
 #        return self._handle_response(response)
+
+# Declarative table of straightforward RPC wrappers: (name, args, docstring).
+# Each arg is either a required parameter name or a (name, default) pair.
+# Methods with bespoke params handling (help, setgenerate, estimateconversion,
+# getcurrencystate, getimports, getexports, getrawtransaction) stay handwritten.
+_RPC_SPECS = [
+    ("getinfo", (), "Returns an object containing various state info."),
+    ("getwalletinfo", (), "Returns an object containing wallet information."),
+    ("stop", (), "Stops the Verus daemon."),
+    ("getnewaddress", (), "Returns a new address from the keypool and marks it as used."),
+    ("validateaddress", ("address",), "Returns information about the given address."),
+    ("getbestblockhash", (), "Returns the hash of the best (tip) block in the longest chain."),
+    ("getblock", ("hash_or_height", ("verbosity", 1)),
+     "Returns block data.\n"
+     "        - If verbosity=0, returns hex-encoded block data.\n"
+     "        - If verbosity=1, returns a JSON object.\n"
+     "        - If verbosity=2, includes detailed transaction data."),
+    ("getblockcount", (), "Returns the number of blocks in the best valid chain."),
+    ("getblockhash", ("index",), "Returns the hash of the block at the given index."),
+    ("getgenerate", (), "Returns whether the daemon is set to mine/mint coins."),
+    ("getmininginfo", (), "Returns mining-related information."),
+    ("getcurrency", ("currency",), "Returns details for a specified currency."),
+    ("getcurrencyconverters", ("currency1", "currency2"), "Returns a list of available currency converters."),
+    ("getidentity", ("identity",), "Returns details for a specified identity (name@ or i-address)."),
+]
+
+# Statically known result shapes, used to specialize the generated wrapper
+# tails: "scalar" results are returned as-is, "object" results are always
+# wrapped in VerusResponseData, neither needing the isinstance dispatch in
+# _handle_response. Methods whose shape depends on arguments (getblock's
+# verbosity) are left out and keep the generic handler.
+_RESULT_KIND = {
+    "getinfo": "object",
+    "getwalletinfo": "object",
+    "stop": "scalar",
+    "getnewaddress": "scalar",
+    "validateaddress": "object",
+    "getbestblockhash": "scalar",
+    "getblockcount": "scalar",
+    "getblockhash": "scalar",
+    "getgenerate": "scalar",
+    "getmininginfo": "object",
+    "getcurrency": "object",
+    "getcurrencyconverters": "scalar",
+    "getidentity": "object",
+}
+
+
+def _spec_signature(arg_specs):
+    """
+    Build the parameter list and params expression for a generated
+    wrapper. Params are emitted as a tuple literal: fixed-size
+    allocation, no list over-allocation, and _dumps encodes tuples and
+    lists identically.
+    """
+    sig_parts = []
+    param_names = []
+    for spec in arg_specs:
+        if isinstance(spec, tuple):
+            arg_name, default = spec
+            sig_parts.append(f"{arg_name}={default!r}")
+        else:
+            arg_name = spec
+            sig_parts.append(arg_name)
+        param_names.append(arg_name)
+    if not param_names:
+        params_expr = "()"
+    elif len(param_names) == 1:
+        params_expr = f"({param_names[0]},)"
+    else:
+        params_expr = "(" + ", ".join(param_names) + ")"
+    return ", ".join(sig_parts), params_expr
+
+
+def _make_method(name, arg_specs, doc, is_async=False):
+    """
+    Generate an RPC wrapper method closing over the method name and a
+    fixed-arity params builder. The generated body is the same two-line
+    request/handle shape the handwritten wrappers use.
+    """
+    sig, params = _spec_signature(arg_specs)
+    sig = "self, " + sig if sig else "self"
+    prefix = "async " if is_async else ""
+    await_kw = "await " if is_async else ""
+    kind = _RESULT_KIND.get(name)
+    if not arg_specs:
+        # Zero-arg methods: the whole body except the id is constant, so
+        # pre-encode it once here instead of on every call.
+        template = _PAYLOAD_TEMPLATE.replace(b"%d", b"%%d") % (_dumps(name), _dumps(()))
+        call_expr = f"{await_kw}self._rpc_request_static({name!r}, {template!r})"
+    else:
+        call_expr = f"{await_kw}self._rpc_request({name!r}, {params})"
+    if kind == "scalar":
+        # _rpc_request already returns the unwrapped result; scalar
+        # methods need no handler frame at all.
+        body = f"    return {call_expr}\n"
+    else:
+        handler = "_handle_object" if kind == "object" else "_handle_response"
+        body = (
+            f"    result = {call_expr}\n"
+            f"    return self.{handler}(result)\n"
+        )
+    src = f"{prefix}def {name}({sig}):\n" + body
+    namespace = {}
+    exec(src, namespace)
+    method = namespace[name]
+    method.__doc__ = doc
+    return method
+
+
+class AsyncVerusClient(_BespokeRPCMethods):
+    """
+    Asyncio variant of VerusClient backed by a pooled httpx.AsyncClient,
+    so independent RPC calls can overlap their network waits:
+
+        async with AsyncVerusClient(...) as c:
+            blocks = await asyncio.gather(*(c.getblock(h) for h in hashes))
+    """
+
+    def __init__(self, host='127.0.0.1', network='mainnet', rpc_user='username', rpc_password='password', pool_size=10):
+        """ Initialize the async client. Takes the same arguments as
+        VerusClient plus pool_size, the maximum number of concurrent
+        connections kept to the daemon.
+        """
+        if httpx is None:
+            raise ImportError("AsyncVerusClient requires the httpx package")
+
+        self.host = host
+        self.network = network.lower()
+        self.rpc_user = rpc_user
+        self.rpc_password = rpc_password
+
+        if self.network == 'mainnet':
+            self.port = 27486
+            self.native_currency = 'vrsc'
+        elif self.network == 'testnet':
+            self.port = 18843
+            self.native_currency = 'vrsctest'
+        else:
+            raise ValueError("Network must be 'mainnet' or 'testnet'")
+
+        self.url = f"http://{self.host}:{self.port}/"
+
+        self._id = itertools.count()
+        self._client = httpx.AsyncClient(
+            auth=(self.rpc_user, self.rpc_password),
+            base_url=self.url,
+            headers={"content-type": "application/json"},
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+
+    async def aclose(self):
+        """
+        Close the underlying HTTP client and its pooled connections.
+        """
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def _rpc_request(self, method, params):
+        """
+        Internal method to send an RPC request. Returns the unwrapped
+        "result" value; a daemon-side error raises VerusRPCError.
+        """
+        response = await self._client.post("/", content=_encode_request(method, params, next(self._id)))
+        if response.status_code >= 400:
+            error = _extract_rpc_error(response.content)
+            if error is not None:
+                _raise_rpc_error(error)
+            response.raise_for_status()
+        return _unwrap_reply(_decode_response(response.content))
+
+    async def _rpc_request_static(self, method, body_template):
+        """
+        Async counterpart of VerusClient._rpc_request_static.
+        """
+        response = await self._client.post("/", content=body_template % next(self._id))
+        if response.status_code >= 400:
+            error = _extract_rpc_error(response.content)
+            if error is not None:
+                _raise_rpc_error(error)
+            response.raise_for_status()
+        return _unwrap_reply(_decode_response(response.content))
+
+    async def _call(self, method, params):
+        """
+        Async counterpart of VerusClient._call. The shared bespoke
+        wrappers return this coroutine, so they are awaited like the
+        generated async methods.
+        """
+        result = await self._rpc_request(method, params)
+        return self._handle_response(result)
+
+    _handle_response = VerusClient._handle_response
+    _handle_object = VerusClient._handle_object
+
+
+for _name, _args, _doc in _RPC_SPECS:
+    setattr(VerusClient, _name, _make_method(_name, _args, _doc))
+    setattr(AsyncVerusClient, _name, _make_method(_name, _args, _doc, is_async=True))
+del _name, _args, _doc